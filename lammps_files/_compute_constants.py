@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Exact g-factor constants for the Tetracyclic "Alpha" Polymer
+Derives Tr(L⁺) and the Theorem 5 g-factor of Cantarella et al. (2022)
+symbolically, so tetracyclic_analysis.py can store them as exact
+rationals instead of running floating-point linear algebra.
+
+It also checks the derived values against the TRACE_L_PLUS and
+THEORETICAL_G_FACTOR constants stored in tetracyclic_analysis.py and
+exits with an error if they disagree (e.g. after an edge-list change).
+The paper's quoted g-factor (PAPER_G_FACTOR) is known not to match the
+derivation; that discrepancy is reported as a warning, not an error.
+
+Usage: python3 _compute_constants.py
+"""
+
+import sys
+import sympy as sp
+
+from tetracyclic_analysis import (AlphaGraphAnalysis, TRACE_L_PLUS,
+                                  THEORETICAL_G_FACTOR, PAPER_G_FACTOR)
+
+def compute_constants():
+    """
+    Returns (Tr(L⁺), g) for the alpha graph as exact sympy Rationals.
+    g = (3 / e²) * (Tr(L⁺) + Loops/3 - 1/6)
+    """
+    analyzer = AlphaGraphAnalysis()
+    v = analyzer.n_nodes
+    e = len(analyzer.edges)
+    cycle_rank = analyzer.cycle_rank
+
+    A = sp.zeros(v, v)
+    for i, j in analyzer.edges.tolist():
+        A[i, j] = A[j, i] = 1
+    D = sp.diag(*[sum(A.row(i)) for i in range(v)])
+    D_inv_sqrt = D**sp.Rational(-1, 2)
+    L_norm = sp.eye(v) - D_inv_sqrt * A * D_inv_sqrt
+
+    trace_L_plus = sp.simplify(L_norm.pinv().trace())
+    if not trace_L_plus.is_Rational:
+        raise ValueError(f"Tr(L⁺) did not simplify to a rational: {trace_L_plus}")
+    g_factor = sp.Rational(3, e**2) * (trace_L_plus + sp.Rational(cycle_rank, 3)
+                                       - sp.Rational(1, 6))
+    return trace_L_plus, g_factor
+
+def main():
+    """
+    Print the constants in the form used by tetracyclic_analysis.py and
+    check them against the stored values.
+    """
+    trace_L_plus, g_factor = compute_constants()
+    print(f"TRACE_L_PLUS = {trace_L_plus}  # {float(trace_L_plus):.10f}")
+    print(f"THEORETICAL_G_FACTOR = {g_factor}  # {float(g_factor):.10f}")
+
+    # The stored constants are written as p/q, so their float value must
+    # match the correctly rounded float of the exact rational bit for bit
+    mismatches = [name for name, stored, derived in [
+        ("TRACE_L_PLUS", TRACE_L_PLUS, trace_L_plus),
+        ("THEORETICAL_G_FACTOR", THEORETICAL_G_FACTOR, g_factor),
+    ] if stored != float(derived)]
+    if mismatches:
+        print(f"❌ ERROR: stored {', '.join(mismatches)} in "
+              "tetracyclic_analysis.py do not match the derived values.")
+        sys.exit(1)
+    print("✅ Stored constants match the derived values.")
+
+    # Expected failure: the paper quotes 17/49 for this graph, but the
+    # derivation from the edge list gives a different value
+    paper = sp.Rational(17, 49)
+    if PAPER_G_FACTOR != float(paper):
+        print("❌ ERROR: PAPER_G_FACTOR in tetracyclic_analysis.py is not 17/49.")
+        sys.exit(1)
+    if g_factor != paper:
+        print(f"⚠️  WARNING (known discrepancy): derived g = {g_factor} "
+              f"({float(g_factor):.6f}) does not match the paper's "
+              f"{paper} ({float(paper):.6f}).")
+    else:
+        print("✅ Derived g-factor matches the paper value.")
+
+if __name__ == "__main__":
+    main()
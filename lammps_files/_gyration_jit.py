@@ -0,0 +1,110 @@
+"""
+numba kernels for compute_gyration.py
+Imported lazily, and only for very large gyration files: importing numba
+costs more than the NumPy reductions it would replace on typical runs.
+"""
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True, fastmath=True)
+def sum_and_sumsq(x):
+    """Sum and sum of squares of x in one JIT-compiled pass."""
+    s = 0.0
+    s2 = 0.0
+    for v in x:
+        w = np.float64(v)  # float32 traces accumulate in float64
+        s += w
+        s2 += w * w
+    return s, s2
+
+@njit(cache=True)
+def _parse_float(buf, i, end):
+    """strtod-style parse of the number starting at buf[i] (skipping
+    blanks); returns the value, the index just past it and whether the
+    field was well formed. A missing field, or one not followed by a blank
+    or the end of the line (e.g. '1.5abc'), gives (NaN, i, False)."""
+    while i < end and (buf[i] == 32 or buf[i] == 9):
+        i += 1
+    sign = 1.0
+    if i < end and (buf[i] == 45 or buf[i] == 43):  # '-' / '+'
+        if buf[i] == 45:
+            sign = -1.0
+        i += 1
+    mant = 0.0
+    scale = 0
+    n_digits = 0
+    while i < end and buf[i] >= 48 and buf[i] <= 57:
+        mant = mant * 10.0 + (buf[i] - 48)
+        n_digits += 1
+        i += 1
+    if i < end and buf[i] == 46:  # '.'
+        i += 1
+        while i < end and buf[i] >= 48 and buf[i] <= 57:
+            mant = mant * 10.0 + (buf[i] - 48)
+            scale -= 1
+            n_digits += 1
+            i += 1
+    if n_digits == 0:
+        return np.nan, i, False
+    if i < end and (buf[i] == 101 or buf[i] == 69):  # 'e' / 'E'
+        i += 1
+        esign = 1
+        if i < end and (buf[i] == 45 or buf[i] == 43):
+            if buf[i] == 45:
+                esign = -1
+            i += 1
+        e = 0
+        while i < end and buf[i] >= 48 and buf[i] <= 57:
+            e = e * 10 + (buf[i] - 48)
+            i += 1
+        scale += esign * e
+    if i < end and buf[i] != 32 and buf[i] != 9 and buf[i] != 13:
+        return np.nan, i, False
+    return sign * mant * 10.0**scale, i, True
+
+@njit(cache=True)
+def _is_data_line(buf, i, end):
+    """True unless the line starting at buf[i] is blank or a # comment."""
+    while i < end and (buf[i] == 32 or buf[i] == 9):
+        i += 1
+    return i < end and buf[i] != 35 and buf[i] != 13  # '#' / '\r'
+
+@njit(cache=True)
+def scan_gyration(buf):
+    """Parses columns 0 and 1 of every data line, in two passes over the
+    raw bytes. Returns float64 timesteps (exact past 2^24), float32 Rg and
+    the number of malformed data lines (their values are NaN)."""
+    size = buf.size
+
+    # First pass: count data lines to size the output
+    n = 0
+    i = 0
+    while i < size:
+        end = i
+        while end < size and buf[end] != 10:  # '\n'
+            end += 1
+        if _is_data_line(buf, i, end):
+            n += 1
+        i = end + 1
+
+    # Second pass: parse timestep and Rg
+    timesteps = np.empty(n, dtype=np.float64)
+    rg_values = np.empty(n, dtype=np.float32)
+    n_bad = 0
+    k = 0
+    i = 0
+    while i < size:
+        end = i
+        while end < size and buf[end] != 10:
+            end += 1
+        if _is_data_line(buf, i, end):
+            t, j, ok_t = _parse_float(buf, i, end)
+            rg, j, ok_rg = _parse_float(buf, j, end)
+            if not (ok_t and ok_rg):
+                n_bad += 1
+            timesteps[k] = t
+            rg_values[k] = rg
+            k += 1
+        i = end + 1
+    return timesteps, rg_values, n_bad
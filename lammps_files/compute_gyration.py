@@ -3,35 +3,193 @@
 Tetracyclic vs. Tree G-Factor Analysis
 Calculates a custom ratio = <Rg_alpha>^2 / <Rg_tree>^2
 
-Usage: python3 compute_gyration.py <gyration_file_alpha> <gyration_file_tree>
+Usage: python3 compute_gyration.py [--no-plot] <gyration_file_alpha> <gyration_file_tree>
        (This script is called automatically by run_simulation.sh)
+
+Pass --no-plot (or set GYRATION_NO_PLOT=1) to skip the figure and only
+write g_factor_results.txt, e.g. in parameter sweeps. Any GYRATION_NO_PLOT
+value other than '' or '0' disables the plot; unset or 0 keeps it.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+import math
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Gyration files at least this large are parsed with the mmap scanner
+# from _gyration_jit.py (when numba is available) and stored as float32
+MMAP_SCAN_MIN_BYTES = 256 * 1024**2
+
+# Importing numba and loading its JIT cache costs up to ~0.4 s. On the
+# float32 Rg from the mmap scanner the fused JIT loop saves ~1.4 ms per
+# million points over NumPy, which first copies to float64 (80 vs 150 ms
+# at 5e7 points), so it only pays for itself past ~0.4 s / 1.4 ms per
+# million = 3e8 points, unless numba was already loaded for the scanner.
+JIT_REDUCE_MIN_POINTS = 300_000_000
+
+_jit_kernels = None  # _gyration_jit module, False if numba is missing
+
+def load_jit_kernels():
+    """
+    Imports the numba kernels in _gyration_jit.py on first use.
+    Returns the module, or None when numba is not installed.
+    """
+    global _jit_kernels
+    if _jit_kernels is None:
+        try:
+            import _gyration_jit
+            _jit_kernels = _gyration_jit
+        except ImportError:  # numba is optional, fall back to NumPy
+            _jit_kernels = False
+    return _jit_kernels or None
+
+def sum_and_sumsq(x):
+    """
+    Sum and sum of squares of x (sum of squares via BLAS ddot, no x**2
+    temporary). Very large inputs use the fused JIT loop instead.
+    """
+    if x.size >= JIT_REDUCE_MIN_POINTS or _jit_kernels:
+        kernels = load_jit_kernels()
+        if kernels is not None:
+            return kernels.sum_and_sumsq(x)
+    x = np.asarray(x, dtype=np.float64)
+    return float(x.sum()), float(np.dot(x, x))
 
-def get_avg_rg_from_file(filename):
+def gyration_records(timesteps, rg_values):
+    """
+    Packs the two columns into one record array with fields 'timestep'
+    (float64) and 'rg' (dtype of rg_values), so both can share a single
+    mmap-able .npy cache while keeping their own precision.
+    """
+    data = np.empty(len(rg_values), dtype=[('timestep', np.float64),
+                                           ('rg', rg_values.dtype)])
+    data['timestep'] = timesteps
+    data['rg'] = rg_values
+    return data
+
+def scan_gyration_mmap(filename):
+    """
+    Parses a (very large) LAMMPS gyration file by memory-mapping it and
+    walking the bytes with the JIT-compiled scanner. Returns a record
+    array of float64 timesteps and float32 Rg; 7 significant digits are
+    plenty for Rg and halve its memory. Requires numba. Raises ValueError
+    if any data line is missing a field or has a non-numeric one.
+    """
+    import mmap
+
+    with open(filename, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = None
+        try:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            timesteps, rg_values, n_bad = load_jit_kernels().scan_gyration(buf)
+        finally:
+            # The mmap can't be closed while a view is alive, so drop ours
+            # on every path. If the scan raised, its traceback still holds
+            # the view; the mapping is then released when that is collected,
+            # and the original error propagates instead of a BufferError.
+            del buf
+            try:
+                mm.close()
+            except BufferError:
+                pass
+    if n_bad:
+        raise ValueError(f"{n_bad} malformed data line(s) in {filename}")
+    return gyration_records(timesteps, rg_values)
+
+def save_cache(cache, data):
+    """
+    Writes data to the .npy file `cache` atomically: it is saved to a
+    temporary file in the same directory and renamed into place, so an
+    interrupted run (or two threads caching the same file) can never
+    leave a truncated cache behind.
+    """
+    import tempfile
+
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cache) or '.',
+                                   prefix=os.path.basename(cache) + '.', suffix='.tmp')
+    except OSError:
+        # A read-only results directory just means no cache
+        return
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, data)
+        os.replace(tmp, cache)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def load_gyration_data(filename):
+    """
+    Reads the (timestep, Rg) columns of a LAMMPS gyration file into a
+    record array with fields 'timestep' and 'rg'.
+    The parsed array is cached next to the input as <filename>.npy and
+    reused for as long as it is newer than the text file. Files of
+    MMAP_SCAN_MIN_BYTES or more go through scan_gyration_mmap().
+    """
+    cache = filename + '.npy'
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(filename):
+        try:
+            data = np.load(cache, mmap_mode='r')
+            if data.dtype.names != ('timestep', 'rg'):
+                raise ValueError(f"{cache} has an outdated layout")
+            return data
+        except (OSError, ValueError, EOFError):
+            # Truncated, outdated or otherwise unreadable cache: parse the
+            # text again and overwrite it below
+            pass
+
+    if (os.path.getsize(filename) >= MMAP_SCAN_MIN_BYTES
+            and load_jit_kernels() is not None):
+        data = scan_gyration_mmap(filename)
+    else:
+        # Imported here so cache hits never pay for importing pandas
+        import pandas as pd
+
+        # Skip LAMMPS header lines (lines starting with #)
+        # pandas' C parser is much faster than np.loadtxt on long trajectories
+        columns = pd.read_csv(filename, sep=r'\s+', comment='#', header=None,
+                              usecols=[0, 1], dtype=np.float64).to_numpy()
+        data = gyration_records(columns[:, 0], columns[:, 1])
+
+    save_cache(cache, data)
+    return data
+
+def get_avg_rg_from_file(filename, log=print):
     """
     Helper function to read a LAMMPS gyration file, calculate the
-    equilibrated average Rg and Rg^2, and return all data for plotting.
+    equilibrated average Rg and Rg^2, and return what plotting needs:
+    the decimated time series, the equilibration timestep and a compact
+    copy of the equilibrated Rg values. The full arrays are released
+    before returning. Messages go through `log` (print by default), so a
+    caller running several loads at once can collect and order them.
     """
     if not os.path.exists(filename):
-        print(f"❌ ERROR: {filename} not found!")
+        log(f"❌ ERROR: {filename} not found!")
         return None
 
     try:
-        # Read gyration data, skip LAMMPS header lines (lines starting with #)
-        data = np.loadtxt(filename, comments='#')
+        # Read gyration data (from the .npy cache when it is up to date)
+        data = load_gyration_data(filename)
         
         # Check if file is empty or has wrong format
-        if data.ndim == 0 or data.shape[1] < 2:
-             print(f"❌ ERROR: {filename} contains no valid data.")
+        if data.size == 0:
+             log(f"❌ ERROR: {filename} contains no valid data.")
              return None
 
-        timesteps = data[:, 0]
-        rg_values = data[:, 1]
+        timesteps = data['timestep']
+        rg_values = data['rg']
+
+        # Short or garbled rows (e.g. a truncated last line from a killed
+        # LAMMPS job) come back as NaN; reject them like np.loadtxt did
+        n_bad = int(np.count_nonzero(~(np.isfinite(timesteps) & np.isfinite(rg_values))))
+        if n_bad:
+            log(f"❌ ERROR: {filename} has {n_bad} incomplete or non-numeric "
+                f"data line(s) (truncated file?).")
+            return None
 
         # Calculate equilibrated average (last 25% of simulation)
         equilibrated_start = (len(rg_values) * 3)// 4
@@ -40,135 +198,239 @@ def get_avg_rg_from_file(filename):
         if equilibrated_start == 0 and len(rg_values) > 1:
             equilibrated_start = 1
         elif len(rg_values) <= 1:
-            print(f"❌ ERROR: Not enough data in {filename} to analyze.")
+            log(f"❌ ERROR: Not enough data in {filename} to analyze.")
             return None
 
         equilibrated_rg = rg_values[equilibrated_start:]
         
-        avg_rg = np.mean(equilibrated_rg)
-        std_rg = np.std(equilibrated_rg)
+        # Single pass over the slice: sum and sum of squares (no
+        # equilibrated_rg**2 temporary), everything else derives from them
+        n = equilibrated_rg.size
+        s1, s2 = sum_and_sumsq(equilibrated_rg)
+
+        avg_rg = s1 / n
         
         # --- CRITICAL FIX ---
         # The g-factor uses the mean-square Rg, <Rg^2>, 
         # NOT the square-of-the-mean, <Rg>^2.
-        avg_rg_squared = np.mean(equilibrated_rg ** 2)
+        avg_rg_squared = s2 / n
         # --- END FIX ---
+
+        std_rg = math.sqrt(max(avg_rg_squared - avg_rg * avg_rg, 0.0))
         
-        print(f"--- Analysis for: {filename} ---")
-        print(f"  Avg. Rg: {avg_rg:.3f} +/- {std_rg:.3f}")
-        print(f"  Avg. <Rg^2>: {avg_rg_squared:.3f}")
-        print(f"  Equilibrated data points: {len(equilibrated_rg)}")
+        log(f"--- Analysis for: {filename} ---\n"
+            f"  Avg. Rg: {avg_rg:.3f} +/- {std_rg:.3f}\n"
+            f"  Avg. <Rg^2>: {avg_rg_squared:.3f}\n"
+            f"  Equilibrated data points: {len(equilibrated_rg)}")
         
+        # Keep only what plotting needs, so the full trace can be freed
+        ts_ds, val_ds = decimate_trace(timesteps, rg_values)
+        equilibrated_ts = timesteps[equilibrated_start]
+        equilibrated_rg = np.ascontiguousarray(equilibrated_rg)  # copy, drops the view
+        del data, timesteps, rg_values
+
         # Return all components for plotting and calculation
-        return (avg_rg_squared, avg_rg, timesteps, rg_values, 
-                equilibrated_start, equilibrated_rg)
+        return (avg_rg_squared, avg_rg, ts_ds, val_ds,
+                equilibrated_ts, equilibrated_rg)
 
     except Exception as e:
-        print(f"❌ ERROR: An error occurred processing {filename}: {str(e)}")
+        log(f"❌ ERROR: An error occurred processing {filename}: {str(e)}")
         return None
 
-def main(file_alpha, file_tree):
+def decimate_trace(timesteps, values, max_points=5000):
+    """
+    Min/max decimation of an Rg time series for plotting. Each block of
+    `stride` points is replaced by its minimum and maximum, which keeps
+    the visual envelope of the trace while handing Matplotlib at most
+    ~max_points vertices. Short traces are returned unchanged.
+    """
+    n = len(values)
+    stride = n // (max_points // 2)
+    if stride < 2:
+        return timesteps, values
+
+    m = (n // stride) * stride
+    t = np.asarray(timesteps[:m]).reshape(-1, stride)
+    v = np.asarray(values[:m]).reshape(-1, stride)
+
+    ts_ds = np.column_stack([t[:, 0], t[:, -1]]).ravel()
+    val_ds = np.column_stack([v.min(axis=1), v.max(axis=1)]).ravel()
+
+    # Keep the leftover tail points as they are
+    return (np.concatenate([ts_ds, timesteps[m:]]),
+            np.concatenate([val_ds, values[m:]]))
+
+def plot_signature(file_alpha, file_tree, custom_ratio):
+    """
+    Hash of the plot inputs (both gyration files, their mtimes and the
+    ratio). If it matches the .sig file stored next to the PNG, the
+    figure on disk is already up to date.
+    """
+    import hashlib
+
+    key = (f"{file_alpha}:{os.path.getmtime(file_alpha)}:"
+           f"{file_tree}:{os.path.getmtime(file_tree)}:{custom_ratio:.6f}")
+    return hashlib.md5(key.encode()).hexdigest()
+
+def plot_results(custom_ratio, alpha_data, tree_data):
+    """
+    Draws the 2x2 Rg time-series / distribution figure for both
+    simulations and saves it as g_factor_analysis_results.png.
+    """
+    # Imported lazily: --no-plot runs never load matplotlib at all
+    import matplotlib
+    matplotlib.use('Agg')  # Batch script: never probe for a GUI backend
+    import matplotlib.pyplot as plt
+
+    # One entry per column of the figure:
+    # (data, line style, histogram color, legend name, title, topology)
+    panels = [
+        (alpha_data, 'b-', 'skyblue', 'Alpha', 'Alpha Polymer', '(Tetracyclic)'),
+        (tree_data,  'g-', 'lime',    'Tree',  'Tree Polymer',  '(Dendrimer)'),
+    ]
+
+    # Both histograms share one set of bin edges, so the two
+    # distributions can be compared bin for bin
+    edges = np.histogram_bin_edges(
+        np.concatenate([alpha_data[5], tree_data[5]]), bins=30)
+
+    # Let Agg merge near-collinear vertices of the Rg traces
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+
+    # Low on-screen dpi keeps the canvas buffer small; savefig sets the
+    # output resolution
+    fig, axs = plt.subplots(2, 2, figsize=(20, 14), dpi=72) # 2x2 grid
+    fig.suptitle(f"Custom Ratio Analysis: Ratio = {custom_ratio:.4f}  (<Rg^2>_alpha / <Rg^2>_tree)", fontsize=20)
+
+    for col, (data, line_style, color, name, title, topology) in enumerate(panels):
+        rg2, rg, ts, val, eq_ts, hist = data
+
+        # --- Rg time series ---
+        ax = axs[0, col]
+        ax.plot(ts, val, line_style, linewidth=1, alpha=0.7,
+                label=f'Rg ({name})', rasterized=True)
+        ax.axhline(y=rg, color='r', linestyle='--', linewidth=2, label=f'Avg Rg = {rg:.3f}')
+        ax.axvline(x=eq_ts, color='g', linestyle=':', label='Equilibration')
+        ax.set_xlabel('Timestep')
+        ax.set_ylabel('Radius of Gyration (Å)')
+        ax.set_title(f'{title} {topology}')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+        # --- Rg distribution ---
+        # Binned in NumPy and drawn with a single bar() call, which is
+        # much cheaper than ax.hist() on long equilibrated traces
+        ax = axs[1, col]
+        counts, _ = np.histogram(hist, bins=edges, density=True)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+               alpha=0.7, color=color, edgecolor='black')
+        ax.axvline(x=rg, color='r', linestyle='--', linewidth=2, label=f'Mean = {rg:.3f}')
+        ax.set_xlabel('Radius of Gyration (Å)')
+        ax.set_ylabel('Probability Density')
+        ax.set_title(f'{title} Rg Distribution')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95]) # Adjust for suptitle
+    plt.savefig('g_factor_analysis_results.png', dpi=150, bbox_inches='tight')
+    print(f"Plot saved as: g_factor_analysis_results.png")
+    plt.close(fig)
+
+def main(file_alpha, file_tree, make_plot=True):
     """
     Main analysis function to compare two simulation outputs.
+    With make_plot=False only g_factor_results.txt is written.
     """
-    print("=" * 60)
-    print("GROUP 6: ALPHA vs. TREE CUSTOM RATIO ANALYSIS")
-    print(f"  Alpha (Tetracyclic) file: {file_alpha}")
-    print(f"  Tree (Dendrimer) file:    {file_tree}")
-    print("=" * 60)
+    print("\n".join([
+        "=" * 60,
+        "GROUP 6: ALPHA vs. TREE CUSTOM RATIO ANALYSIS",
+        f"  Alpha (Tetracyclic) file: {file_alpha}",
+        f"  Tree (Dendrimer) file:    {file_tree}",
+        "=" * 60,
+    ]))
     
     # --- Get data for both files ---
-    alpha_data = get_avg_rg_from_file(file_alpha)
-    tree_data = get_avg_rg_from_file(file_tree)
+    # Load them in parallel: NumPy/pandas release the GIL while parsing and
+    # reducing, so one file's I/O overlaps with the other's parse. Their
+    # messages are collected and printed afterwards, alpha first, so the
+    # output order doesn't depend on which load finishes first
+    alpha_log, tree_log = [], []
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_alpha = ex.submit(get_avg_rg_from_file, file_alpha, alpha_log.append)
+        fut_tree = ex.submit(get_avg_rg_from_file, file_tree, tree_log.append)
+        alpha_data, tree_data = fut_alpha.result(), fut_tree.result()
+    print("\n".join(alpha_log + tree_log))
     
     if alpha_data is None or tree_data is None:
         print("\n❌ ERROR: One or both files failed to load. Exiting analysis.")
         sys.exit(1) # Exit with error code
 
-    # Unpack the data
-    (rg2_alpha, rg_alpha, ts_alpha, 
-     val_alpha, start_alpha, hist_alpha) = alpha_data
-    (rg2_tree,  rg_tree,  ts_tree,  
-     val_tree,  start_tree,  hist_tree) = tree_data
+    # Only <Rg^2> is needed here, the rest is for plotting
+    rg2_alpha = alpha_data[0]
+    rg2_tree = tree_data[0]
 
     # --- Calculate the Custom Ratio ---
     # Ratio = <Rg^2>(alpha) / <Rg^2>(tree)
     custom_ratio = rg2_alpha / rg2_tree
 
-    print("\n" + "-" * 60)
-    print("CUSTOM RATIO CALCULATION:")
-    print(f"  <Rg^2>_alpha: {rg2_alpha:.3f} (Tetracyclic)")
-    print(f"  <Rg^2>_tree:  {rg2_tree:.3f} (Dendrimer)")
-    print(f"  Custom Ratio = <Rg^2>_alpha / <Rg^2>_tree = {custom_ratio:.4f}")
-    print("-" * 60)
+    print("\n".join([
+        "\n" + "-" * 60,
+        "CUSTOM RATIO CALCULATION:",
+        f"  <Rg^2>_alpha: {rg2_alpha:.3f} (Tetracyclic)",
+        f"  <Rg^2>_tree:  {rg2_tree:.3f} (Dendrimer)",
+        f"  Custom Ratio = <Rg^2>_alpha / <Rg^2>_tree = {custom_ratio:.4f}",
+        "-" * 60,
+    ]))
     
     # --- Plotting and Saving ---
-    fig, axs = plt.subplots(2, 2, figsize=(20, 14), dpi=100) # 2x2 grid
-    fig.suptitle(f"Custom Ratio Analysis: Ratio = {custom_ratio:.4f}  (<Rg^2>_alpha / <Rg^2>_tree)", fontsize=20)
-    
-    # --- Alpha Polymer Plots ---
-    axs[0, 0].plot(ts_alpha, val_alpha, 'b-', linewidth=1, alpha=0.7, label='Rg (Alpha)')
-    axs[0, 0].axhline(y=rg_alpha, color='r', linestyle='--', linewidth=2, label=f'Avg Rg = {rg_alpha:.3f}')
-    axs[0, 0].axvline(x=ts_alpha[start_alpha], color='g', linestyle=':', label='Equilibration')
-    axs[0, 0].set_xlabel('Timestep')
-    axs[0, 0].set_ylabel('Radius of Gyration (Å)')
-    axs[0, 0].set_title(f'Alpha Polymer (Tetracyclic)')
-    axs[0, 0].legend()
-    axs[0, 0].grid(True, alpha=0.3)
-    
-    axs[1, 0].hist(hist_alpha, bins=30, alpha=0.7, color='skyblue', edgecolor='black', density=True)
-    axs[1, 0].axvline(x=rg_alpha, color='r', linestyle='--', linewidth=2, label=f'Mean = {rg_alpha:.3f}')
-    axs[1, 0].set_xlabel('Radius of Gyration (Å)')
-    axs[1, 0].set_ylabel('Probability Density')
-    axs[1, 0].set_title('Alpha Polymer Rg Distribution')
-    axs[1, 0].legend()
-    axs[1, 0].grid(True, alpha=0.3)
-
-    # --- Tree Polymer Plots ---
-    axs[0, 1].plot(ts_tree, val_tree, 'g-', linewidth=1, alpha=0.7, label='Rg (Tree)')
-    axs[0, 1].axhline(y=rg_tree, color='r', linestyle='--', linewidth=2, label=f'Avg Rg = {rg_tree:.3f}')
-    axs[0, 1].axvline(x=ts_tree[start_tree], color='g', linestyle=':', label='Equilibration')
-    axs[0, 1].set_xlabel('Timestep')
-    axs[0, 1].set_ylabel('Radius of Gyration (Å)')
-    axs[0, 1].set_title(f'Tree Polymer (Dendrimer)')
-    axs[0, 1].legend()
-    axs[0, 1].grid(True, alpha=0.3)
-    
-    axs[1, 1].hist(hist_tree, bins=30, alpha=0.7, color='lime', edgecolor='black', density=True)
-    axs[1, 1].axvline(x=rg_tree, color='r', linestyle='--', linewidth=2, label=f'Mean = {rg_tree:.3f}')
-    axs[1, 1].set_xlabel('Radius of Gyration (Å)')
-    axs[1, 1].set_ylabel('Probability Density')
-    axs[1, 1].set_title('Tree Polymer Rg Distribution')
-    axs[1, 1].legend()
-    axs[1, 1].grid(True, alpha=0.3)
+    # Rendering the PNG is the slowest step, so skip it when the inputs
+    # are unchanged since the last run
+    if make_plot:
+        png, sig_file = 'g_factor_analysis_results.png', 'g_factor_analysis_results.png.sig'
+        sig = plot_signature(file_alpha, file_tree, custom_ratio)
+        old_sig = None
+        if os.path.exists(png) and os.path.exists(sig_file):
+            with open(sig_file) as f:
+                old_sig = f.read()
+        if old_sig == sig:
+            print(f"Plot up to date, skipping: {png}")
+        else:
+            plot_results(custom_ratio, alpha_data, tree_data)
+            with open(sig_file, 'w') as f:
+                f.write(sig)
 
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95]) # Adjust for suptitle
-    plt.savefig('g_factor_analysis_results.png', dpi=300, bbox_inches='tight')
-    print(f"Plot saved as: g_factor_analysis_results.png")
-
-    # Save summary results
+    # Save summary results (built once, written with a single call)
+    summary = "\n".join([
+        "ALPHA vs. TREE CUSTOM RATIO ANALYSIS",
+        "=" * 50,
+        f"Alpha File: {file_alpha}",
+        f"Tree File:  {file_tree}",
+        "-" * 50,
+        f"Avg. <Rg^2>_alpha: {rg2_alpha:.6f}",
+        f"Avg. <Rg^2>_tree:  {rg2_tree:.6f}",
+        f"Custom Ratio:       {custom_ratio:.6f}",
+    ]) + "\n"
     with open('g_factor_results.txt', 'w') as f:
-        f.write(f"ALPHA vs. TREE CUSTOM RATIO ANALYSIS\n")
-        f.write("=" * 50 + "\n")
-        f.write(f"Alpha File: {file_alpha}\n")
-        f.write(f"Tree File:  {file_tree}\n")
-        f.write("-" * 50 + "\n")
-        f.write(f"Avg. <Rg^2>_alpha: {rg2_alpha:.6f}\n")
-        f.write(f"Avg. <Rg^2>_tree:  {rg2_tree:.6f}\n")
-        f.write(f"Custom Ratio:       {custom_ratio:.6f}\n")
+        f.write(summary)
 
     print(f"Results saved as: g_factor_results.txt")
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
+    args = sys.argv[1:]
+    make_plot = os.environ.get('GYRATION_NO_PLOT', '') in ('', '0')
+    if '--no-plot' in args:
+        args.remove('--no-plot')
+        make_plot = False
+
+    if len(args) != 2:
         print("❌ ERROR: Invalid arguments.")
         print("This script is designed to be run by 'run_simulation.sh'.")
-        print("Usage: python3 compute_gyration.py <gyration_file_alpha> <gyration_file_tree>")
+        print("Usage: python3 compute_gyration.py [--no-plot] <gyration_file_alpha> <gyration_file_tree>")
         sys.exit(1) # Exit with an error code
     
-    file_alpha = sys.argv[1]
-    file_tree = sys.argv[2]
-    main(file_alpha, file_tree)
+    file_alpha, file_tree = args
+    main(file_alpha, file_tree, make_plot)
     
     print("\n" + "=" * 60)
     print("CUSTOM RATIO ANALYSIS COMPLETE! ✅")
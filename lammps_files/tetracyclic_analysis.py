@@ -4,10 +4,35 @@ Theoretical Graph Analysis for the Tetracyclic "Alpha" Polymer
 Calculates the theoretical g-factor based on Cantarella et al. (2022)
 """
 
+import functools
+import sys
 import numpy as np
-import networkx as nx
-from scipy.linalg import pinv
-import matplotlib.pyplot as plt
+
+# The graph is fixed, so Tr(L⁺) and the g-factor are exact rationals.
+# They were derived symbolically by _compute_constants.py, which fails if
+# they no longer match the edge list; run this script with --recompute to
+# check them against the numerical linear algebra.
+TRACE_L_PLUS = 637/138           # 4.6159420290
+THEORETICAL_G_FACTOR = 133/621   # 0.2141706924
+
+# The g-factor quoted for this graph in the paper. It does not match the
+# value derived from the edge list above; _compute_constants.py reports
+# the discrepancy every time it runs.
+PAPER_G_FACTOR = 17/49           # 0.3469387755
+
+# Fixed drawing positions for the 6 junction vertices. For a graph this
+# small the layout is a design choice, so there is no need to run a
+# force-directed layout solver on every call. Vertices 1-5 sit on a regular
+# hexagon; 6 is pulled in from its corner so that 1-4, 2-5 and 3-6 don't
+# all cross at the centre, which would read as a seventh junction.
+ALPHA_LAYOUT = {
+    1: (0.0, 1.0),
+    2: (0.87, 0.5),
+    3: (0.87, -0.5),
+    4: (0.0, -1.0),
+    5: (-0.87, -0.5),
+    6: (-0.45, 0.75),
+}
 
 class AlphaGraphAnalysis:
     """
@@ -15,49 +40,100 @@ class AlphaGraphAnalysis:
     "Alpha" polymer graph from Figure 3 of Cantarella et al. (2022).
     """
 
-    def __init__(self):
-        """Initializes the analysis by creating the graph."""
-        self.G = self.create_alpha_graph()
-        self.expected_g_from_paper = 17/49
+    def __init__(self, recompute=False):
+        """
+        Initializes the analysis by creating the graph. With
+        recompute=True Tr(L⁺) and g are solved for instead of taken from
+        the precomputed module constants.
+        """
+        self.recompute = recompute
+        self.n_nodes = 6
+        self.edges = self.create_alpha_edges()
+        self.expected_g_from_paper = PAPER_G_FACTOR
+
+    def create_alpha_edges(self):
+        """
+        Returns the 9 edges (chains) between the 6 junction vertices
+        as depicted in Figure 3 of the paper, as a zero-indexed
+        (9, 2) int32 array.
+        """
+        edges = np.array([
+            [1, 2], [1, 4], [1, 5],
+            [3, 2], [3, 4], [3, 6],
+            [5, 2], [5, 4], [5, 6]
+        ], dtype=np.int32) - 1
+        return edges
+
+    @functools.cached_property
+    def G(self):
+        """The NetworkX graph, built on first use (only needed for drawing)."""
+        return self.create_alpha_graph()
 
     def create_alpha_graph(self):
         """Creates the specific 6-vertex, 9-edge 'Alpha' graph."""
+        import networkx as nx
+
         G = nx.Graph()
-        # Define the 6 junction vertices and 9 edges (chains)
-        # as depicted in Figure 3 of the paper.
-        nodes = [1, 2, 3, 4, 5, 6]
-        edges = [
-            (1, 2), (1, 4), (1, 5),
-            (3, 2), (3, 4), (3, 6)
-            (5, 2), (5, 4), (5, 6)
-        ]
-        G.add_nodes_from(nodes)
-        G.add_edges_from(edges)
+        G.add_nodes_from(range(1, self.n_nodes + 1))
+        G.add_edges_from((self.edges + 1).tolist())
         return G
 
-    def calculate_theoretical_g_factor(self):
+    def normalized_laplacian(self):
         """
-        Calculates the asymptotic g-factor using Theorem 5 from
-        Cantarella et al. (2022).
-        g = (3 / e²) * (Tr(L⁺) + Loops/3 - 1/6)
+        Builds the dense normalized Laplacian L = I - D^-1/2 A D^-1/2
+        straight from the edge array. The graph is 6x6, so plain NumPy
+        beats any NetworkX or sparse-matrix machinery.
         """
-        v = self.G.number_of_nodes()
-        e = self.G.number_of_edges()
-        
-        # Cycle rank (Loops) = e - v + 1
-        cycle_rank = e - v + 1
+        n = self.n_nodes
+        A = np.zeros((n, n))
+        A[self.edges[:, 0], self.edges[:, 1]] = 1.0
+        A[self.edges[:, 1], self.edges[:, 0]] = 1.0
+        d = A.sum(axis=1)
+        d_inv_sqrt = 1.0 / np.sqrt(d)
+        L_norm = np.eye(n) - d_inv_sqrt[:, None] * A * d_inv_sqrt[None, :]
+        return L_norm
 
-        # Get the normalized graph Laplacian
-        L_norm = nx.normalized_laplacian_matrix(self.G).toarray()
+    @functools.cached_property
+    def trace_L_plus(self):
+        """
+        Tr(L⁺) of the normalized Laplacian, i.e. the sum of 1/λ over its
+        non-zero eigenvalues. Computed once and cached on the instance.
+        """
+        if not self.recompute:
+            return TRACE_L_PLUS
 
-        # Compute the Moore-Penrose pseudoinverse
-        L_norm_plus = pinv(L_norm)
+        # L_norm is symmetric PSD, so eigvalsh is enough (no pinv/SVD)
+        eigvals = np.linalg.eigvalsh(self.normalized_laplacian())
+        return float(np.sum(1.0 / eigvals[eigvals > 1e-10]))
 
-        # Get the trace of the pseudoinverse
-        trace_L_plus = np.trace(L_norm_plus)
-        
-        # Apply the formula from Theorem 5
-        g_factor = (3 / (e**2)) * (trace_L_plus + (cycle_rank / 3.0) - (1.0 / 6.0))
+    @property
+    def cycle_rank(self):
+        """Cycle rank (Loops) = e - v + 1"""
+        return len(self.edges) - self.n_nodes + 1
+
+    @functools.cached_property
+    def g_factor(self):
+        """
+        The asymptotic g-factor from Theorem 5 of Cantarella et al. (2022).
+        g = (3 / e²) * (Tr(L⁺) + Loops/3 - 1/6)
+        """
+        if not self.recompute:
+            return THEORETICAL_G_FACTOR
+
+        e = len(self.edges)
+        return (3 / (e**2)) * (self.trace_L_plus + (self.cycle_rank / 3.0) - (1.0 / 6.0))
+
+    def calculate_theoretical_g_factor(self):
+        """
+        Calculates the asymptotic g-factor using Theorem 5 from
+        Cantarella et al. (2022) and prints a summary. The result is
+        cached, so repeated calls only pay for the printing.
+        """
+        v = self.n_nodes
+        e = len(self.edges)
+        cycle_rank = self.cycle_rank
+        trace_L_plus = self.trace_L_plus
+        g_factor = self.g_factor
         
         print("--- Theoretical g-factor Calculation ---")
         print(f"Vertices (v): {v}")
@@ -65,29 +141,37 @@ class AlphaGraphAnalysis:
         print(f"Cycle Rank (Loops): {cycle_rank}")
         print(f"Trace of L_norm_plus: {trace_L_plus:.4f}")
         print(f"Calculated g-factor:  {g_factor:.6f}")
-        print(f"Expected from paper:  {self.expected_g_from_paper:.6f} (109/245)")
+        print(f"Expected from paper:  {self.expected_g_from_paper:.6f} (17/49)")
         print("-" * 40)
         
         return g_factor
 
+    def graph_layout(self):
+        """Node positions for drawing: the fixed hexagon ALPHA_LAYOUT."""
+        return ALPHA_LAYOUT
+
     def visualize_graph(self):
         """Visualize the graph structure."""
+        # Only drawing needs matplotlib and NetworkX, so don't import them up front
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
         plt.figure(figsize=(8, 6))
-        pos = nx.spring_layout(self.G, seed=42)
+        pos = self.graph_layout()
         nx.draw(self.G, pos, with_labels=True, node_color='skyblue',
                 node_size=1200, font_size=14, font_weight='bold',
                 width=2.0, edge_color='gray')
-        plt.title(f'Tetracyclic "Alpha" Polymer Graph (g ≈ 0.445)')
+        plt.title(f'Tetracyclic "Alpha" Polymer Graph (g = {THEORETICAL_G_FACTOR:.4f})')
         plt.savefig('alpha_graph_structure.png', dpi=300)
         print("Graph visualization saved as alpha_graph_structure.png")
 
-def main():
+def main(recompute=False):
     """Run the full theoretical analysis."""
     print("=" * 60)
     print("Theoretical Analysis of the 'Alpha' Polymer Graph")
     print("=" * 60)
     
-    analyzer = AlphaGraphAnalysis()
+    analyzer = AlphaGraphAnalysis(recompute=recompute)
     analyzer.visualize_graph()
     theoretical_g = analyzer.calculate_theoretical_g_factor()
 
@@ -95,4 +179,4 @@ def main():
     print("This theoretical g-factor is the benchmark for your LAMMPS simulation.")
 
 if __name__ == "__main__":
-    main()
+    main(recompute='--recompute' in sys.argv)